@@ -340,6 +340,25 @@ class PlexObject:
             and attrs. See :func:`~plexapi.base.PlexObject.fetchItem` for more details
             on how this is used.
         """
+        data, kwargs = self._prepareFindItems(data, cls, rtag, **kwargs)
+        # loop through all data elements to find matches
+        items = MediaContainer[cls](self._server, data, initpath=initpath) if data.tag == 'MediaContainer' else []
+        items.extend(self._iterFindItems(data, cls, initpath, **kwargs))
+        return items
+
+    def findItem(self, data, cls=None, initpath=None, rtag=None, **kwargs):
+        """ Load the specified data to find and build the first items with the specified tag
+            and attrs. See :func:`~plexapi.base.PlexObject.fetchItem` for more details
+            on how this is used.
+        """
+        data, kwargs = self._prepareFindItems(data, cls, rtag, **kwargs)
+        # stop at the first match instead of building every matching item
+        return next(self._iterFindItems(data, cls, initpath, **kwargs), None)
+
+    def _prepareFindItems(self, data, cls=None, rtag=None, **kwargs):
+        """ Returns the data element and attribute filters used by
+            :func:`~plexapi.base.PlexObject.findItems` and :func:`~plexapi.base.PlexObject.findItem`.
+        """
         # filter on cls attrs if specified
         if cls and cls.TAG and 'tag' not in kwargs:
             kwargs['etag'] = cls.TAG
@@ -348,24 +367,15 @@ class PlexObject:
         # rtag to iter on a specific root tag using breadth-first search
         if rtag:
             data = next(utils.iterXMLBFS(data, rtag), Element('Empty'))
-        # loop through all data elements to find matches
-        items = MediaContainer[cls](self._server, data, initpath=initpath) if data.tag == 'MediaContainer' else []
+        return data, kwargs
+
+    def _iterFindItems(self, data, cls=None, initpath=None, **kwargs):
+        """ Yields the items built from the data elements matching the specified attrs. """
         for elem in data:
             if self._checkAttrs(elem, **kwargs):
                 item = self._buildItemOrNone(elem, cls, initpath)
                 if item is not None:
-                    items.append(item)
-        return items
-
-    def findItem(self, data, cls=None, initpath=None, rtag=None, **kwargs):
-        """ Load the specified data to find and build the first items with the specified tag
-            and attrs. See :func:`~plexapi.base.PlexObject.fetchItem` for more details
-            on how this is used.
-        """
-        try:
-            return self.findItems(data, cls, initpath, rtag, **kwargs)[0]
-        except IndexError:
-            return None
+                    yield item
 
     def firstAttr(self, *attrs):
         """ Return the first attribute in attrs that is not None. """
@@ -38,7 +38,7 @@ class PlexConfig(ConfigParser):
                 section, name = key.lower().split('.')
                 value = self.data.get(section, {}).get(name, default)
             return utils.cast(cast, value) if cast else value
-        except:  # noqa: E722
+        except (AttributeError, KeyError, TypeError, ValueError):
             return default
 
     def _asDict(self):
@@ -3053,7 +3053,7 @@ class ManagedHub(PlexObject):
         if not self._promoted:
             raise BadRequest('Collection must be a Managed Recommendation to be removed')
         if not self.deletable:
-            raise BadRequest(f'{self.title} managed hub cannot be removed' % self.title)
+            raise BadRequest(f'{self.title} managed hub cannot be removed')
         key = f'/hubs/sections/{self.librarySectionID}/manage/{self.identifier}'
         self._server.query(key, method=self._server._session.delete)
 
@@ -3304,11 +3304,8 @@ class Common(PlexObject):
         self.year = utils.cast(int, data.attrib.get('year'))
 
     def __repr__(self):
-        return '<%s:%s:%s>' % (
-            self.__class__.__name__,
-            self.commonType,
-            ','.join(str(key) for key in self.ratingKeys)
-        )
+        ratingKeys = ','.join(str(key) for key in self.ratingKeys)
+        return f'<{self.__class__.__name__}:{self.commonType}:{ratingKeys}>'
 
     @property
     def commonType(self):
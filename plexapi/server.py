@@ -161,6 +161,12 @@ class PlexServer(PlexObject):
         self.version = data.attrib.get('version')
         self.voiceSearch = utils.cast(bool, data.attrib.get('voiceSearch'))
 
+    def _reload(self, key=None, **kwargs):
+        """ Perform the actual reload. """
+        data = self.query(self.key, timeout=self._timeout)
+        self._loadData(data)
+        return self
+
     def _headers(self, **kwargs):
         """ Returns dict containing base headers for all requests to the server. """
         headers = BASE_HEADERS.copy()
@@ -23,8 +23,6 @@ you can set items to be synced to your app) you need to init some variables.
 You have to fake platform/device/model because transcoding profiles are hardcoded in Plex, and you obviously have
 to explicitly specify that your app supports `sync-target`.
 """
-import requests
-
 import plexapi
 from plexapi.base import PlexObject
 from plexapi.exceptions import NotFound, BadRequest
@@ -97,7 +95,7 @@ class SyncItem(PlexObject):
                 media (base.Playable): the media to be marked as downloaded.
         """
         url = f'/sync/{self.clientIdentifier}/item/{media.ratingKey}/downloaded'
-        media._server.query(url, method=requests.put)
+        media._server.query(url, method=media._server._session.put)
 
     def delete(self):
         """ Removes current SyncItem """
@@ -224,7 +224,7 @@ def rget(obj, attrstr, default=None, delim='.'):  # pragma: no cover
         if attrstr:
             return rget(value, attrstr, default, delim)
         return value
-    except:  # noqa: E722
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError):
         return default
 
 
@@ -337,22 +337,30 @@ def toDatetime(value, format=None):
                 log.info('Failed to parse "%s" to datetime as format "%s", defaulting to None', value, format)
                 return None
         else:
-            try:
-                value = int(value)
-            except ValueError:
-                log.info('Failed to parse "%s" to datetime as timestamp, defaulting to None', value)
-                return None
-            try:
-                return datetime.fromtimestamp(value)
-            except (OSError, OverflowError, ValueError):
-                try:
-                    return datetime.fromtimestamp(0) + timedelta(seconds=value)
-                except OverflowError:
-                    log.info('Failed to parse "%s" to datetime as timestamp (out-of-bounds), defaulting to None', value)
-                    return None
+            return _timestampToDatetime(value)
     return value
 
 
+@functools.lru_cache(maxsize=1024)
+def _timestampToDatetime(value):
+    """ Returns a datetime object from the specified timestamp. Results are cached because
+        the same timestamps are repeated many times when loading large listings.
+    """
+    try:
+        value = int(value)
+    except ValueError:
+        log.info('Failed to parse "%s" to datetime as timestamp, defaulting to None', value)
+        return None
+    try:
+        return datetime.fromtimestamp(value)
+    except (OSError, OverflowError, ValueError):
+        try:
+            return datetime.fromtimestamp(0) + timedelta(seconds=value)
+        except OverflowError:
+            log.info('Failed to parse "%s" to datetime as timestamp (out-of-bounds), defaulting to None', value)
+            return None
+
+
 def millisecondToHumanstr(milliseconds):
     """ Returns human readable time duration [D day[s], ]HH:MM:SS.UUU from milliseconds.
 
@@ -417,7 +425,7 @@ def downloadSessionImages(server, filename=None, height=150, width=150,
                 prettyname = media._prettyfilename()
                 filename = f'session_transcode_{media.usernames[0]}_{prettyname}_{int(time.time())}'
             url = server.transcodeImage(url, height, width, opacity, saturation)
-            filepath = download(url, server._token, filename=filename)
+            filepath = download(url, server._token, filename=filename, session=server._session)
             info['username'] = {'filepath': filepath, 'url': url}
     return info
 
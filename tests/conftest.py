@@ -5,10 +5,12 @@ import time
 from datetime import datetime
 from functools import partial
 
+import numpy as np
 import plexapi
 import pytest
 import requests
-from PIL import Image, ImageColor, ImageStat
+from requests.adapters import HTTPAdapter
+from PIL import Image, ImageColor
 from plexapi.client import PlexClient
 from plexapi.exceptions import NotFound
 from plexapi.myplex import MyPlexAccount
@@ -119,6 +121,8 @@ def pytest_runtest_setup(item):
 @pytest.fixture(scope="session")
 def sess():
     session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_maxsize=20))
+    session.mount("https://", HTTPAdapter(pool_maxsize=20))
     session.request = partial(session.request, timeout=120)
     return session
 
@@ -441,23 +445,32 @@ def wait_until(condition_function, delay=0.25, timeout=1, *args, **kwargs):
     return ready
 
 
-def detect_color_image(file, thumb_size=150, MSE_cutoff=22, adjust_color_bias=True):
+def detect_color_image(file, thumb_size=64, MSE_cutoff=22, adjust_color_bias=True):
     # http://stackoverflow.com/questions/20068945/detect-if-image-is-color-grayscale-or-black-and-white-with-python-pil
     pilimg = Image.open(file)
     bands = pilimg.getbands()
     if bands == ("R", "G", "B") or bands == ("R", "G", "B", "A"):
-        thumb = pilimg.resize((thumb_size, thumb_size))
-        sse, bias = 0, [0, 0, 0]
+        # Let the JPEG decoder downscale while decoding (no-op for other formats)
+        pilimg.draft("RGB", (thumb_size * 2, thumb_size * 2))
+        thumb = pilimg.resize((thumb_size, thumb_size), Image.Resampling.BOX)
+        pixels = np.frombuffer(thumb.convert("RGB").tobytes(), dtype=np.uint8)
+        arr = pixels.reshape(thumb_size, thumb_size, 3).astype(np.int16)
+        # Channel deviations from the pixel mean, scaled by 3 to stay in integers
+        diff = 3 * arr - arr.sum(axis=2, keepdims=True)
+        bias = [0, 0, 0]
         if adjust_color_bias:
-            bias = ImageStat.Stat(thumb).mean[:3]
-            bias = [b - sum(bias) / 3 for b in bias]
-        for pixel in thumb.getdata():
-            mu = sum(pixel) / 3
-            sse += sum(
-                (pixel[i] - mu - bias[i]) * (pixel[i] - mu - bias[i]) for i in [0, 1, 2]
-            )
-        mse = float(sse) / (thumb_size * thumb_size)
-        return "grayscale" if mse <= MSE_cutoff else "color"
+            # Each channel's mean minus the mean of all channels
+            bias = (diff.reshape(-1, 3).mean(axis=0) / 3).tolist()
+        # The bias is the mean deviation of each channel, so it can be taken out of the total
+        # and folded into the limit (scaled by 9 to match the scaled deviations)
+        limit = 9 * thumb_size * thumb_size * (MSE_cutoff + sum(b * b for b in bias))
+        sse = 0
+        for row in range(0, thumb_size, 16):
+            block = diff[row:row + 16]
+            sse += int(np.einsum("ijk,ijk->", block, block, dtype=np.int64))
+            if sse > limit:
+                return "color"
+        return "grayscale"
     elif len(bands) == 1:
         return "blackandwhite"
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import re
-import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
 from urllib.parse import quote_plus
 
 import pytest
@@ -34,11 +35,18 @@ def test_server_attr(plex, account):
 
 
 def test_server_alert_listener(plex, movies):
+    messages = []
+    received = Event()
+
+    def callback(data):
+        messages.append(data)
+        if len(messages) >= 3:
+            received.set()
+
     try:
-        messages = []
-        listener = plex.startAlertListener(messages.append)
+        listener = plex.startAlertListener(callback)
         movies.refresh()
-        utils.wait_until(lambda: len(messages) >= 3, delay=1, timeout=30)
+        assert received.wait(timeout=30), f"Only received {len(messages)} alerts"
         assert len(messages) >= 3
     finally:
         listener.stop()
@@ -73,27 +81,28 @@ def test_server_transcodeImage(tmpdir, plex, movie):
     online_no_upscale_url = plex.transcodeImage(
         "https://raw.githubusercontent.com/pkkid/python-plexapi/master/tests/data/cute_cat.jpg", 1000, 1000, upscale=False)
 
-    original_img = download(
-        original_url, plex._token, savepath=str(tmpdir), filename="original_img",
-    )
-    resized_jpeg_img = download(
-        resize_jpeg_url, plex._token, savepath=str(tmpdir), filename="resized_jpeg_img"
-    )
-    no_minSize_png_img = download(
-        no_minSize_png_url, plex._token, savepath=str(tmpdir), filename="no_minSize_png_img"
-    )
-    grayscale_img = download(
-        grayscale_url, plex._token, savepath=str(tmpdir), filename="grayscale_img"
-    )
-    opacity_background_img = download(
-        opacity_background_url, plex._token, savepath=str(tmpdir), filename="opacity_background_img"
-    )
-    blend_img = download(
-        blend_url, plex._token, savepath=str(tmpdir), filename="blend_img"
-    )
-    online_no_upscale_img = download(
-        online_no_upscale_url, plex._token, savepath=str(tmpdir), filename="online_no_upscale_img"
-    )
+    downloads = [
+        (original_url, "original_img"),
+        (resize_jpeg_url, "resized_jpeg_img"),
+        (no_minSize_png_url, "no_minSize_png_img"),
+        (grayscale_url, "grayscale_img"),
+        (opacity_background_url, "opacity_background_img"),
+        (blend_url, "blend_img"),
+        (online_no_upscale_url, "online_no_upscale_img"),
+    ]
+    with ThreadPoolExecutor(max_workers=len(downloads)) as executor:
+        (
+            original_img,
+            resized_jpeg_img,
+            no_minSize_png_img,
+            grayscale_img,
+            opacity_background_img,
+            blend_img,
+            online_no_upscale_img,
+        ) = executor.map(
+            lambda args: download(args[0], plex._token, savepath=str(tmpdir), filename=args[1], session=plex._session),
+            downloads
+        )
 
     with Image.open(original_img) as image:
         assert image.size[0] != width
@@ -114,6 +123,22 @@ def test_server_transcodeImage(tmpdir, plex, movie):
             assert image1.size == image2.size
 
 
+def test_server_reload(requests_mock):
+    baseurl = "http://plex.test:32400"
+    requests_mock.get(f"{baseurl}/", [
+        {"text": '<MediaContainer friendlyName="before" version="1.0.0" />'},
+        {"text": '<MediaContainer friendlyName="after" version="1.1.0" allowMediaDeletion="1" />'},
+    ])
+    plex = PlexServer(baseurl, "faketoken")
+    assert plex.friendlyName == "before"
+    assert plex.allowMediaDeletion is None
+    assert plex.reload() is plex
+    assert plex.friendlyName == "after"
+    assert plex.version == "1.1.0"
+    assert plex.allowMediaDeletion is True
+    assert requests_mock.call_count == 2
+
+
 def test_server_fetchitem_notfound(plex):
     with pytest.raises(NotFound):
         plex.fetchItem(123456789)
@@ -174,13 +199,10 @@ def test_server_playlist(plex, show):
 
 
 def test_server_playlists(plex, show):
-    playlists = plex.playlists()
-    count = len(playlists)
     episodes = show.episodes()
     playlist = plex.createPlaylist("test_playlist", items=episodes[:3])
     try:
-        playlists = plex.playlists()
-        assert len(playlists) == count + 1
+        assert playlist in plex.playlists()
         assert playlist in plex.playlists(playlistType='video')
         assert playlist not in plex.playlists(playlistType='audio')
     finally:
@@ -357,55 +379,32 @@ def test_server_browse(plex, movies):
     # browse root
     paths = plex.browse()
     assert len(paths)
-    # browse the path of the movie library
-    paths = plex.browse(movies_path)
-    assert len(paths)
-    # browse the path of the movie library without files
+    # browse the path of the movie library without files (server-side filter)
     paths = plex.browse(movies_path, includeFiles=False)
     assert not len([f for f in paths if f.TAG == 'File'])
-    # walk the path of the movie library
+    # walk the path of the movie library (the first step browses movies_path itself)
     for path, paths, files in plex.walk(movies_path):
         assert path.startswith(movies_path)
         assert len(paths) or len(files)
 
 
-def test_server_allowMediaDeletion(account):
-    plex = PlexServer(utils.SERVER_BASEURL, account.authenticationToken)
-    # Check server current allowMediaDeletion setting
-    if plex.allowMediaDeletion:
-        # If allowed then test disallowed
-        plex._allowMediaDeletion(False)
-        time.sleep(1)
-        plex = PlexServer(utils.SERVER_BASEURL, account.authenticationToken)
-        assert plex.allowMediaDeletion is None
-        # Test redundant toggle
-        with pytest.raises(BadRequest):
-            plex._allowMediaDeletion(False)
-
-        plex._allowMediaDeletion(True)
-        time.sleep(1)
-        plex = PlexServer(utils.SERVER_BASEURL, account.authenticationToken)
-        assert plex.allowMediaDeletion is True
-        # Test redundant toggle
-        with pytest.raises(BadRequest):
-            plex._allowMediaDeletion(True)
-    else:
-        # If disallowed then test allowed
-        plex._allowMediaDeletion(True)
-        time.sleep(1)
-        plex = PlexServer(utils.SERVER_BASEURL, account.authenticationToken)
-        assert plex.allowMediaDeletion is True
-        # Test redundant toggle
-        with pytest.raises(BadRequest):
-            plex._allowMediaDeletion(True)
-
-        plex._allowMediaDeletion(False)
-        time.sleep(1)
-        plex = PlexServer(utils.SERVER_BASEURL, account.authenticationToken)
-        assert plex.allowMediaDeletion is None
-        # Test redundant toggle
-        with pytest.raises(BadRequest):
-            plex._allowMediaDeletion(False)
+def _toggle_allowMediaDeletion(plex, toggle):
+    # The attribute is only present on the server when media deletion is allowed
+    expected = True if toggle else None
+    plex._allowMediaDeletion(toggle)
+    utils.wait_until(lambda: plex.reload().allowMediaDeletion is expected, delay=0.1, timeout=5)
+    assert plex.allowMediaDeletion is expected
+    # Test redundant toggle
+    with pytest.raises(BadRequest):
+        plex._allowMediaDeletion(toggle)
+
+
+def test_server_allowMediaDeletion(account, sess):
+    plex = PlexServer(utils.SERVER_BASEURL, account.authenticationToken, session=sess)
+    # Flip the current setting first, then restore it
+    toggles = [False, True] if plex.allowMediaDeletion else [True, False]
+    for toggle in toggles:
+        _toggle_allowMediaDeletion(plex, toggle)
 
 
 def test_server_system_accounts(plex):
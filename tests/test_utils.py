@@ -1,16 +1,35 @@
 # -*- coding: utf-8 -*-
 import time
+from datetime import datetime
 
 import plexapi.utils as utils
 import pytest
+from PIL import Image, ImageOps
 from plexapi.exceptions import NotFound
 
+from . import conftest
+
 
 def test_utils_toDatetime():
     assert (
         str(utils.toDatetime("2006-03-03", format="%Y-%m-%d")) == "2006-03-03 00:00:00"
     )
     # assert str(utils.toDatetime('0'))[:-9] in ['1970-01-01', '1969-12-31']
+    assert utils.toDatetime("1600000000") == datetime.fromtimestamp(1600000000)
+    assert utils.toDatetime("not-a-timestamp") is None
+
+
+def test_utils_detect_color_image(tmpdir):
+    with Image.open(conftest.STUB_IMAGE_PATH) as image:
+        images = {
+            "blackandwhite": image.copy(),
+            "grayscale": image.convert("RGB"),
+            "color": ImageOps.colorize(image, black="#000080", white="#ffff00", mid="#ff0000"),
+        }
+    for expected, image in images.items():
+        filepath = str(tmpdir.join(f"{expected}.jpg"))
+        image.save(filepath, format="JPEG")
+        assert conftest.detect_color_image(filepath) == expected
 
 
 def test_utils_threaded():
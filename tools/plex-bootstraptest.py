@@ -11,19 +11,25 @@ python plex-bootraptest.py --no-docker --server-name name_of_server --account He
 
 """
 import argparse
+import ctypes
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import functools
+import math
 import os
 import shutil
 import socket
+import sys
+import threading
 import time
-from glob import glob
 from os import makedirs
 from shutil import copyfile, which
 from subprocess import call
 from uuid import uuid4
 
 import plexapi
-from plexapi.exceptions import BadRequest, NotFound
+import requests
+from plexapi.exceptions import BadRequest, NotFound, Unauthorized
 from plexapi.myplex import MyPlexAccount
 from plexapi.server import PlexServer
 from plexapi.utils import SEARCHTYPES
@@ -80,6 +86,16 @@ STUB_MOVIE_PATH = os.path.join(BASE_DIR_PATH, "tests", "data", "video_stub.mp4")
 STUB_MP3_PATH = os.path.join(BASE_DIR_PATH, "tests", "data", "audio_stub.mp3")
 STUB_IMAGE_PATH = os.path.join(BASE_DIR_PATH, "tests", "data", "cute_cat.jpg")
 
+# ioctl request to clone a file on Linux filesystems like btrfs and XFS
+FICLONE = 0x40049409
+
+# Network interfaces created by docker and VPNs, never used as the advertise IP
+VIRTUAL_INTERFACE_PREFIXES = ("docker", "br-", "veth", "tun", "tap", "virbr")
+
+# Retries start at 0.1s and back off exponentially up to this cap
+RETRY_BACKOFF = 1.6
+MAX_RETRY_DELAY = 2.0
+
 
 def check_ext(path, ext):
     """I hate glob so much."""
@@ -93,6 +109,54 @@ def check_ext(path, ext):
     return result
 
 
+@functools.lru_cache(maxsize=None)
+def get_libsystem():
+    """ Load the macOS system library (for clonefile) once, on first use. """
+    return ctypes.CDLL("/usr/lib/libSystem.dylib", use_errno=True)
+
+
+def cp(src, dst):
+    """ Copy src to dst, cloning the file instead when the filesystem supports it.
+        Clones are separate files (unlike hardlinks) so Plex still scans them.
+    """
+    try:
+        if sys.platform == "darwin":
+            if get_libsystem().clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+                return
+        elif sys.platform.startswith("linux"):
+            import fcntl
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            return
+    except (AttributeError, ImportError, OSError):
+        pass
+    copyfile(src, dst)
+
+
+def count_ext(path, ext):
+    """ Return the number of files directly in path with the given extension. """
+    with os.scandir(path) as entries:
+        return sum(1 for entry in entries if entry.is_file() and entry.name.endswith(ext))
+
+
+def get_existing_files(path):
+    """ Return the names of the files in path, listed with a single directory scan. """
+    with os.scandir(path) as entries:
+        return {entry.name for entry in entries if entry.is_file()}
+
+
+class DockerPull(threading.Thread):
+    """ Pull the Plex docker image on a background thread. """
+
+    def __init__(self, tag):
+        super().__init__(daemon=True)
+        self.cmd = ["docker", "pull", "plexinc/pms-docker:%s" % tag]
+        self.exit_code = None
+
+    def run(self):
+        self.exit_code = call(self.cmd)
+
+
 class ExistingSection(Exception):
     """This server has sections, exiting"""
 
@@ -144,7 +208,7 @@ def setup_music(music_path, docker=False):
             makedirs(artist_album, exist_ok=True)
             for song in v:
                 trackpath = os.path.join(artist_album, song)
-                copyfile(STUB_MP3_PATH, trackpath)
+                cp(STUB_MP3_PATH, trackpath)
 
                 if docker:
                     reltrackpath = os.path.relpath(trackpath, os.path.dirname(music_path))
@@ -160,20 +224,19 @@ def setup_music(music_path, docker=False):
 def setup_movies(movies_path):
     print("Setup files for the Movies section..")
     makedirs(movies_path, exist_ok=True)
-    if len(glob(movies_path + "/*.mkv", recursive=True)) == 4:
-        return 4
-
     required_movies = {
         "Elephants Dream": 2006,
         "Sita Sings the Blues": 2008,
         "Big Buck Bunny": 2008,
         "Sintel": 2010,
     }
+    existing_movies = get_existing_files(movies_path)
     expected_media_count = 0
     for name, year in required_movies.items():
         expected_media_count += 1
-        if not os.path.isfile(get_movie_path(movies_path, name, year)):
-            copyfile(STUB_MOVIE_PATH, get_movie_path(movies_path, name, year))
+        movie_path = get_movie_path(movies_path, name, year)
+        if os.path.basename(movie_path) not in existing_movies:
+            cp(STUB_MOVIE_PATH, movie_path)
 
     return expected_media_count
 
@@ -182,25 +245,23 @@ def setup_images(photos_path):
     print("Setup files for the Photos section..")
 
     makedirs(photos_path, exist_ok=True)
-    # expected_photo_count = 0
     folders = {
         ("Cats",): 3,
         ("Cats", "Cats in bed"): 7,
         ("Cats", "Cats not in bed"): 1,
         ("Cats", "Not cats in bed"): 1,
     }
-    has_photos = 0
     for folder_path, required_cnt in folders.items():
         folder_path = os.path.join(photos_path, *folder_path)
         makedirs(folder_path, exist_ok=True)
-        photos_in_folder = len(glob(os.path.join(folder_path, "/*.jpg")))
+        photos_in_folder = count_ext(folder_path, ".jpg")
         while photos_in_folder < required_cnt:
             # Dunno why this is need got permission error on photo0.jpg
             photos_in_folder += 1
             full_path = os.path.join(folder_path, "photo%d.jpg" % photos_in_folder)
-            copyfile(STUB_IMAGE_PATH, full_path)
-            has_photos += photos_in_folder
+            cp(STUB_IMAGE_PATH, full_path)
 
+    # Count once after setup; this is the fixed target for the Photos scan
     return len(check_ext(photos_path, (".jpg")))
 
 
@@ -214,34 +275,68 @@ def setup_show(tvshows_path):
         "The 100": [list(range(1, 14)), list(range(1, 17))],
     }
     expected_media_count = 0
+    missing_episodes = []
     for show_name, seasons in required_tv_shows.items():
+        existing_episodes = get_existing_files(os.path.join(tvshows_path, show_name))
         for season_id, episodes in enumerate(seasons, start=1):
             for episode_id in episodes:
                 expected_media_count += 1
                 episode_path = get_tvshow_path(
                     tvshows_path, show_name, season_id, episode_id
                 )
-                if not os.path.isfile(episode_path):
-                    copyfile(STUB_MOVIE_PATH, episode_path)
+                if os.path.basename(episode_path) not in existing_episodes:
+                    missing_episodes.append(episode_path)
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(lambda episode_path: cp(STUB_MOVIE_PATH, episode_path), missing_episodes))
 
     return expected_media_count
 
 
 def get_default_ip():
     """ Return the first IP address of the current machine if available. """
-    available_ips = list(
+    try:
+        import psutil
+        # Read the interface addresses directly to avoid a (possibly slow) hostname lookup.
+        # Only IPv4 is used (the address ends up in unbracketed URLs) and container
+        # bridge interfaces are skipped so the host's own address is advertised.
+        addresses = [
+            address.address
+            for interface, addresses in psutil.net_if_addrs().items()
+            if not interface.startswith(VIRTUAL_INTERFACE_PREFIXES)
+            for address in addresses
+            if address.family == socket.AF_INET
+        ]
+    except ImportError:
+        addresses = [i[4][0] for i in socket.getaddrinfo(socket.gethostname(), None)]
+    available_ips = sorted(
         set(
             [
-                i[4][0]
-                for i in socket.getaddrinfo(socket.gethostname(), None)
-                if i[4][0] not in ("127.0.0.1", "::1")
-                and not i[4][0].startswith("fe80:")
+                ip
+                for ip in addresses
+                if ip != "::1" and not ip.startswith(("127.", "fe80:"))
             ]
         )
     )
     return available_ips[0] if len(available_ips) else None
 
 
+def needs_login_prompt(opts):
+    """ Return True if get_plex_account() will have to prompt for credentials. """
+    if opts.unclaimed or opts.token or (opts.username and opts.password):
+        return False
+    config = plexapi.CONFIG
+    return not (config.get("auth.myplex_username") and config.get("auth.myplex_password"))
+
+
+def positive_float(value):
+    """ Argparse type for a float option that must be finite and greater than zero. """
+    value = float(value)
+    if not (math.isfinite(value) and value > 0):
+        raise argparse.ArgumentTypeError("%s is not a finite number greater than zero" % value)
+    return value
+
+
 def get_plex_account(opts):
     """ Authenticate with Plex using the command line options. """
     if not opts.unclaimed:
@@ -261,27 +356,35 @@ def get_tvshow_path(tvshows_path, name, season, episode):
     return os.path.join(tvshows_path, name, "S%02dE%02d.mp4" % (season, episode))
 
 
+def is_starting_up(err):
+    """ Return True if the error means the Plex server is still starting up. """
+    return "server is still starting up. Please retry later" in str(err)
+
+
 def add_library_section(server, section):
     """ Add the specified section to our Plex instance. This tends to be a bit
         flaky, so we retry a few times here.
     """
     start = time.time()
     runtime = 0
+    delay = 0.1
     while runtime < 60:
         try:
             server.library.add(**section)
             return True
         except BadRequest as err:
-            if "server is still starting up. Please retry later" in str(err):
-                time.sleep(1)
-                continue
-            raise
+            if not is_starting_up(err):
+                raise
+            time.sleep(delay)
+            delay = min(MAX_RETRY_DELAY, delay * RETRY_BACKOFF)
         runtime = time.time() - start
     raise SystemExit("Timeout adding section to Plex instance.")
 
 
-def create_section(server, section, opts):  # noqa: C901
+def create_section(server, section, opts, alert_callbacks):  # noqa: C901
     processed_media = 0
+    lock = threading.Lock()
+    finished = threading.Event()
     expected_media_count = section.pop("expected_media_count", 0)
     expected_media_type = (section["type"],)
     if section["type"] == "show":
@@ -290,9 +393,16 @@ def create_section(server, section, opts):  # noqa: C901
         expected_media_type = ("artist", "album", "track")
     expected_media_type = tuple(SEARCHTYPES[t] for t in expected_media_type)
 
+    def media_processed(cnt):
+        nonlocal processed_media
+        with lock:
+            bar.update(cnt)
+            processed_media += cnt
+            if processed_media >= expected_media_count:
+                finished.set()
+
     def alert_callback(data):
         """ Listen to the Plex notifier to determine when metadata scanning is complete. """
-        global processed_media
         if data["type"] == "timeline":
             for entry in data["TimelineEntry"]:
                 if (
@@ -312,30 +422,27 @@ def create_section(server, section, opts):  # noqa: C901
                                     entry["sectionID"]
                                 ).get(entry["title"])
                                 cnt = show.leafCount
-                            bar.update(cnt)
-                            processed_media += cnt
+                            media_processed(cnt)
                         # state=1 means record processed, when no metadata source was set
                         elif (
                             entry["state"] == 1
                             and entry["type"] == SEARCHTYPES["photo"]
                         ):
-                            bar.update()
-                            processed_media += 1
+                            media_processed(1)
 
-    runtime = 0
     start = time.time()
     bar = tqdm(desc="Scanning section " + section["name"], total=expected_media_count)
-    notifier = server.startAlertListener(alert_callback)
-    time.sleep(3)
+    if not expected_media_count:
+        finished.set()
+    alert_callbacks.append(alert_callback)
     add_library_section(server, section)
-    while bar.n < bar.total:
+    while not finished.wait(timeout=opts.poll_interval):
+        runtime = int(time.time() - start)
         if runtime >= 120:
             print("Metadata scan taking too long, but will continue anyway..")
             break
-        time.sleep(3)
-        runtime = int(time.time() - start)
     bar.close()
-    notifier.stop()
+    alert_callbacks.remove(alert_callback)
 
 
 if __name__ == "__main__":  # noqa: C901
@@ -387,6 +494,12 @@ if __name__ == "__main__":  # noqa: C901
         default=180,
         type=int,
     )  # noqa
+    parser.add_argument(
+        "--poll-interval",
+        help="Seconds between checks for metadata scan completion (default: %(default)s)",
+        default=3.0,
+        type=positive_float,
+    )  # noqa
     parser.add_argument(
         "--server-name",
         help="Name for the new server",
@@ -431,12 +544,9 @@ if __name__ == "__main__":  # noqa: C901
     )  # noqa
     opts, _ = parser.parse_known_args()
 
-    account = get_plex_account(opts)
-    path = os.path.realpath(os.path.expanduser(opts.destination))
-    media_path = os.path.join(path, "media")
-    makedirs(media_path, exist_ok=True)
-
-    # Download the Plex Docker image
+    # Download the Plex Docker image in the background while authenticating,
+    # unless we have to prompt for credentials (docker output would bury the prompt)
+    docker_pull = None
     if opts.no_docker is False:
         print(
             "Creating Plex instance named %s with advertised ip %s"
@@ -445,7 +555,21 @@ if __name__ == "__main__":  # noqa: C901
         if which("docker") is None:
             print("Docker is required to be available")
             exit(1)
-        if call(["docker", "pull", "plexinc/pms-docker:%s" % opts.docker_tag]) != 0:
+        if not needs_login_prompt(opts):
+            docker_pull = DockerPull(opts.docker_tag)
+            docker_pull.start()
+
+    account = get_plex_account(opts)
+    path = os.path.realpath(os.path.expanduser(opts.destination))
+    media_path = os.path.join(path, "media")
+    makedirs(media_path, exist_ok=True)
+
+    if opts.no_docker is False:
+        if docker_pull is None:
+            docker_pull = DockerPull(opts.docker_tag)
+            docker_pull.start()
+        docker_pull.join()
+        if docker_pull.exit_code != 0:
             print("Got an error when executing docker pull!")
             exit(1)
 
@@ -472,20 +596,28 @@ if __name__ == "__main__":  # noqa: C901
     print("Waiting for the Plex to start..")
     start = time.time()
     runtime = 0
+    delay = 0.1
     server = None
+    # Reuse one connection pool across retries instead of a new session per attempt
+    session = requests.Session()
     while not server and (runtime < opts.bootstrap_timeout):
         try:
             if account:
                 server = account.device(opts.server_name).connect()
             else:
-                server = PlexServer("http://%s:32400" % opts.advertise_ip)
+                server = PlexServer("http://%s:32400" % opts.advertise_ip, session=session)
 
         except KeyboardInterrupt:
             break
 
-        except Exception as err:
+        except Unauthorized:
+            raise
+
+        except (BadRequest, NotFound, requests.exceptions.RequestException) as err:
+            # The server is not registered or not accepting connections yet
             print(err)
-            time.sleep(1)
+            time.sleep(delay)
+            delay = min(MAX_RETRY_DELAY, delay * RETRY_BACKOFF)
 
         runtime = time.time() - start
 
@@ -497,8 +629,20 @@ if __name__ == "__main__":  # noqa: C901
     print("Plex container started after %ss" % int(runtime))
     print("Plex server version %s" % server.version)
 
+    # Start listening for alerts now so the websocket is connected by the time
+    # the library sections are added. Each section registers its own callback.
+    alert_callbacks = []
+
+    def alert_callback(data):
+        for callback in list(alert_callbacks):
+            callback(data)
+
+    notifier = server.startAlertListener(alert_callback)
+
     if opts.accept_eula:
-        server.settings.get("acceptedEULA").set(True)
+        eula = server.settings.get("acceptedEULA")
+        if not eula.value:
+            eula.set(True)
     # Disable settings for background tasks when using the test server.
     # These tasks won't work on the test server since we are using fake media files
     if not opts.unclaimed and account and account.subscriptionActive:
@@ -622,7 +766,8 @@ if __name__ == "__main__":  # noqa: C901
     if sections:
         print("Creating the Plex libraries on %s" % server.friendlyName)
         for section in sections:
-            create_section(server, section, opts)
+            create_section(server, section, opts, alert_callbacks)
+    notifier.stop()
 
     # Share this instance with the specified username
     if account: